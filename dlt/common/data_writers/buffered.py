@@ -1,5 +1,6 @@
 import gzip
 import time
+from functools import partial
 from typing import ClassVar, List, IO, Any, Optional, Type, Generic
 
 from dlt.common.typing import TDataItem, TDataItems
@@ -28,6 +29,8 @@ class BufferedDataWriter(Generic[TWriter]):
         file_max_items: Optional[int] = None
         file_max_bytes: Optional[int] = None
         disable_compression: bool = False
+        file_buffer_size: int = 1024 * 1024
+        """Size of the write buffer of uncompressed files, gzip files use their own buffer"""
         _caps: Optional[DestinationCapabilitiesContext] = None
 
         __section__: ClassVar[str] = known_sections.DATA_WRITER
@@ -42,6 +45,7 @@ class BufferedDataWriter(Generic[TWriter]):
         file_max_items: int = None,
         file_max_bytes: int = None,
         disable_compression: bool = False,
+        file_buffer_size: int = 1024 * 1024,
         _caps: DestinationCapabilitiesContext = None
     ):
         self.writer_spec = writer_spec
@@ -60,9 +64,11 @@ class BufferedDataWriter(Generic[TWriter]):
         if self.file_max_bytes is None and _caps:
             self.file_max_bytes = _caps.recommended_file_size
         self.file_max_items = file_max_items
-        # the open function is either gzip.open or open
+        # the open function is either gzip.open or open with large write buffer
         self.open = (
-            gzip.open if self.writer_spec.supports_compression and not disable_compression else open
+            gzip.open
+            if self.writer_spec.supports_compression and not disable_compression
+            else partial(open, buffering=file_buffer_size)
         )
 
         self._current_columns: TTableSchemaColumns = None
@@ -114,19 +120,19 @@ class BufferedDataWriter(Generic[TWriter]):
             else:
                 new_rows_count = 1
         self._buffered_items_count += new_rows_count
+        # set last modification date
+        self._last_modified = time.time()
         # flush if max buffer exceeded
         if self._buffered_items_count >= self.buffer_max_items:
             self._flush_items()
-        # set last modification date
-        self._last_modified = time.time()
-        # rotate the file if max_bytes exceeded
-        if self._file:
-            # rotate on max file size
-            if self.file_max_bytes and self._file.tell() >= self.file_max_bytes:
-                self._rotate_file()
-            # rotate on max items
-            elif self.file_max_items and self._writer.items_count >= self.file_max_items:
-                self._rotate_file()
+            # file size and items count change only on flush so rotation is checked here
+            if self._file:
+                # rotate on max file size
+                if self.file_max_bytes and self._file.tell() >= self.file_max_bytes:
+                    self._rotate_file()
+                # rotate on max items
+                elif self.file_max_items and self._writer.items_count >= self.file_max_items:
+                    self._rotate_file()
         return new_rows_count
 
     def write_empty_file(self, columns: TTableSchemaColumns) -> DataWriterMetrics:
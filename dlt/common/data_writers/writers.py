@@ -6,6 +6,7 @@ from typing import (
     Any,
     ClassVar,
     Dict,
+    Iterable,
     List,
     Literal,
     Optional,
@@ -69,11 +70,21 @@ class DataWriterMetrics(NamedTuple):
             )
         return NotImplemented
 
+    @staticmethod
+    def sum_items(metrics: Iterable["DataWriterMetrics"]) -> int:
+        """Sums items count without creating intermediate metrics tuples"""
+        return sum(m.items_count for m in metrics)
+
 
 EMPTY_DATA_WRITER_METRICS = DataWriterMetrics("", 0, 0, 2**32, 0.0)
 
 
 class DataWriter(abc.ABC):
+    _ITEM_FORMAT_FROM_EXTENSION: ClassVar[Dict[str, TDataItemFormat]] = {
+        "typed-jsonl": "object",
+        "parquet": "arrow",
+    }
+
     def __init__(self, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> None:
         self._f = f
         self._caps = caps
@@ -120,11 +131,9 @@ class DataWriter(abc.ABC):
     @classmethod
     def item_format_from_file_extension(cls, extension: str) -> TDataItemFormat:
         """Simple heuristic to get data item format from file extension"""
-        if extension == "typed-jsonl":
-            return "object"
-        elif extension == "parquet":
-            return "arrow"
-        else:
+        try:
+            return cls._ITEM_FORMAT_FROM_EXTENSION[extension]
+        except KeyError:
             raise ValueError(f"Cannot figure out data item format for extension {extension}")
 
     @staticmethod
@@ -150,9 +159,9 @@ class DataWriter(abc.ABC):
 class JsonlWriter(DataWriter):
     def write_data(self, rows: Sequence[Any]) -> None:
         super().write_data(rows)
-        for row in rows:
-            json.dump(row, self._f)
-            self._f.write(b"\n")
+        if rows:
+            # encode all rows and write them at once, gzip compresses per write call
+            self._f.write(b"\n".join(map(json.dumpb, rows)) + b"\n")
 
     @classmethod
     def writer_spec(cls) -> FileWriterSpec:
@@ -384,7 +384,10 @@ TNewColumns = Sequence[Tuple[int, pyarrow.Field, Callable[[pyarrow.Table], Itera
 
 
 def pq_stream_with_new_columns(
-    parquet_file: TFileOrPath, columns: TNewColumns, row_groups_per_read: int = 1
+    parquet_file: TFileOrPath,
+    columns: TNewColumns,
+    row_groups_per_read: int = 1,
+    memory_map: bool = False,
 ) -> Iterator[pyarrow.Table]:
     """Add column(s) to the table in batches.
 
@@ -395,11 +398,12 @@ def pq_stream_with_new_columns(
         columns: list of columns to add in the form of (insertion index, `pyarrow.Field`, column_value_callback)
             The callback should accept a `pyarrow.Table` and return an array of values for the column.
         row_groups_per_read: number of row groups to read at a time. Defaults to 1.
+        memory_map: memory map the file if `parquet_file` is a path. Defaults to False.
 
     Yields:
         `pyarrow.Table` objects with the new columns added.
     """
-    with pyarrow.parquet.ParquetFile(parquet_file) as reader:
+    with pyarrow.parquet.ParquetFile(parquet_file, memory_map=memory_map) as reader:
         n_groups = reader.num_row_groups
         # Iterate through n row groups at a time
         for i in range(0, n_groups, row_groups_per_read):
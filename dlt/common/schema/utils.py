@@ -466,6 +466,18 @@ def merge_table(table: TTableSchema, partial_table: TPartialTableSchema) -> TPar
     return diff
 
 
+def merge_partial_tables(partial_tables: Sequence[TPartialTableSchema]) -> TPartialTableSchema:
+    """Merges `partial_tables` of a single table in order into a new partial table.
+
+    Partial tables are not modified. Raises the same exceptions as `merge_table`
+    """
+    merged_table = copy(partial_tables[0])
+    merged_table["columns"] = copy(merged_table["columns"])
+    for partial_table in partial_tables[1:]:
+        merge_table(merged_table, partial_table)
+    return merged_table
+
+
 def has_table_seen_data(table: TTableSchema) -> bool:
     """Checks if normalizer has seen data coming to the table."""
     return "x-normalizer" in table and table["x-normalizer"].get("seen-data", None) is True  # type: ignore[typeddict-item]
@@ -305,9 +305,11 @@ class FileStorage:
 
     @staticmethod
     def open_zipsafe_ro(path: str, mode: str = "r", **kwargs: Any) -> IO[Any]:
-        """Opens a file using gzip.open if it is a gzip file, otherwise uses open."""
+        """Opens a file using gzip.open if it is a gzip file, otherwise uses open.
+        `buffering` is passed only to `open`, gzip file uses its own read buffer."""
         assert "r" in mode, "FileStorage.open_zipsafe_ro only supports read modes"
         encoding = kwargs.pop("encoding", encoding_for_mode(mode))
+        buffering = kwargs.pop("buffering", -1)
         origmode = str(mode)
         try:
             if encoding is not None and mode == "r":
@@ -317,7 +319,7 @@ class FileStorage:
             f.read(2), f.seek(0)
             return cast(IO[Any], f)
         except (gzip.BadGzipFile, OSError):
-            return open(path, origmode, encoding=encoding, **kwargs)
+            return open(path, origmode, buffering=buffering, encoding=encoding, **kwargs)
 
     @staticmethod
     def is_gzipped(path: str) -> bool:
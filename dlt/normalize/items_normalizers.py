@@ -1,15 +1,16 @@
-from typing import List, Dict, Set, Any
+import os
+from typing import List, Dict, Set, Any, Type
 from abc import abstractmethod
 
 from dlt.common import logger
 from dlt.common.json import json
 from dlt.common.data_writers import DataWriterMetrics
-from dlt.common.data_writers.writers import ArrowToObjectAdapter
+from dlt.common.data_writers.writers import ArrowToObjectAdapter, TDataItemFormat
 from dlt.common.json import custom_pua_decode, may_have_pua
 from dlt.common.runtime import signals
 from dlt.common.schema.typing import TSchemaEvolutionMode, TTableSchemaColumns, TSchemaContractDict
 from dlt.common.schema.utils import has_table_seen_data
-from dlt.common.storages import NormalizeStorage
+from dlt.common.storages import NormalizeStorage, FileStorage
 from dlt.common.storages.data_item_storage import DataItemStorage
 from dlt.common.storages.load_package import ParsedLoadJobFileName
 from dlt.common.typing import DictStrAny, TDataItem
@@ -47,6 +48,9 @@ class ItemsNormalizer:
 
 
 class JsonLItemsNormalizer(ItemsNormalizer):
+    READ_BUFFER_SIZE = 1 << 20
+    """Read buffer for extracted items files. Lines are still split by the (native) buffered reader"""
+
     def __init__(
         self,
         item_storage: DataItemStorage,
@@ -80,10 +84,17 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         schema_update: TSchemaUpdate = {}
         schema = self.schema
         schema_name = schema.name
+        load_id = self.load_id
         normalize_data_fun = self.schema.normalize_data_item
+        # bind what is used for every row to locals
+        filter_row = schema.filter_row
+        coerce_row = schema.coerce_row
+        write_data_item = self.item_storage.write_data_item
+        filtered_tables = self._filtered_tables
+        filtered_tables_columns = self._filtered_tables_columns
 
         for item in items:
-            items_gen = normalize_data_fun(item, self.load_id, root_table_name)
+            items_gen = normalize_data_fun(item, load_id, root_table_name)
             try:
                 should_descend: bool = None
                 # use send to prevent descending into child rows when row was discarded
@@ -92,13 +103,13 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                     (table_name, parent_table), row = row_info
 
                     # rows belonging to filtered out tables are skipped
-                    if table_name in self._filtered_tables:
+                    if table_name in filtered_tables:
                         # stop descending into further rows
                         should_descend = False
                         continue
 
                     # filter row, may eliminate some or all fields
-                    row = schema.filter_row(table_name, row)
+                    row = filter_row(table_name, row)
                     # do not process empty rows
                     if not row:
                         should_descend = False
@@ -106,7 +117,7 @@ class JsonLItemsNormalizer(ItemsNormalizer):
 
                     # filter columns or full rows if schema contract said so
                     # do it before schema inference in `coerce_row` to not trigger costly migration code
-                    filtered_columns = self._filtered_tables_columns.get(table_name, None)
+                    filtered_columns = filtered_tables_columns.get(table_name, None)
                     if filtered_columns:
                         row = self._filter_columns(filtered_columns, row)  # type: ignore[arg-type]
                         # if whole row got dropped
@@ -120,7 +131,7 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                             row[k] = custom_pua_decode(v)  # type: ignore
 
                     # coerce row of values into schema table, generating partial table with new columns if any
-                    row, partial_table = schema.coerce_row(table_name, parent_table, row)
+                    row, partial_table = coerce_row(table_name, parent_table, row)
 
                     # if we detect a migration, check schema contract
                     if partial_table:
@@ -136,9 +147,9 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                         if filters:
                             for entity, name, mode in filters:
                                 if entity == "tables":
-                                    self._filtered_tables.add(name)
+                                    filtered_tables.add(name)
                                 elif entity == "columns":
-                                    filtered_columns = self._filtered_tables_columns.setdefault(
+                                    filtered_columns = filtered_tables_columns.setdefault(
                                         table_name, {}
                                     )
                                     filtered_columns[name] = mode
@@ -174,9 +185,7 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                     #   will be useful if we implement bad data sending to a table
                     # we skip write when discovering schema for empty file
                     if not skip_write:
-                        self.item_storage.write_data_item(
-                            self.load_id, schema_name, table_name, row, columns
-                        )
+                        write_data_item(load_id, schema_name, table_name, row, columns)
             except StopIteration:
                 pass
             signals.raise_if_signalled()
@@ -188,8 +197,10 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         root_table_name: str,
     ) -> List[TSchemaUpdate]:
         schema_updates: List[TSchemaUpdate] = []
-        with self.normalize_storage.extracted_packages.storage.open_file(
-            extracted_items_file, "rb"
+        with FileStorage.open_zipsafe_ro(
+            self.normalize_storage.extracted_packages.storage.make_full_path(extracted_items_file),
+            "rb",
+            buffering=self.READ_BUFFER_SIZE,
         ) as f:
             # enumerate jsonl file line by line
             line: bytes = None
@@ -251,11 +262,17 @@ class ArrowItemsNormalizer(ItemsNormalizer):
             table_updates = schema_update.setdefault(root_table_name, [])
             table_updates.append(table_update)
             load_id_type = pa.dictionary(pa.int8(), pa.string())
+            # build load id column from constant indices into a single value dictionary
+            # without materializing python list per batch
+            load_id_dictionary = pa.array([load_id], type=pa.string())
+            load_id_index = pa.scalar(0, type=pa.int8())
             new_columns.append(
                 (
                     -1,
                     pa.field("_dlt_load_id", load_id_type, nullable=False),
-                    lambda batch: pa.array([load_id] * batch.num_rows, type=load_id_type),
+                    lambda batch: pa.DictionaryArray.from_arrays(
+                        pa.repeat(load_id_index, batch.num_rows), load_id_dictionary
+                    ),
                 )
             )
 
@@ -283,36 +300,37 @@ class ArrowItemsNormalizer(ItemsNormalizer):
         # if we use adapter to convert arrow to dicts, then normalization is not necessary
         is_native_arrow_writer = not issubclass(self.item_storage.writer_cls, ArrowToObjectAdapter)
         should_normalize: bool = None
-        with self.normalize_storage.extracted_packages.storage.open_file(
-            extracted_items_file, "rb"
-        ) as f:
-            for batch in pyarrow.pq_stream_with_new_columns(
-                f, new_columns, row_groups_per_read=self.REWRITE_ROW_GROUPS
-            ):
-                items_count += batch.num_rows
-                # we may need to normalize
-                if is_native_arrow_writer and should_normalize is None:
-                    should_normalize, _, _, _, _ = pyarrow.should_normalize_arrow_schema(
-                        batch.schema, columns_schema, schema.naming
-                    )
-                    if should_normalize:
-                        logger.info(
-                            f"When writing arrow table to {root_table_name} the schema requires"
-                            " normalization because its shape does not match the actual schema of"
-                            " destination table. Arrow table columns will be reordered and missing"
-                            " columns will be added if needed."
-                        )
+        # memory map the file so row groups are read from page cache without extra copies
+        for batch in pyarrow.pq_stream_with_new_columns(
+            self.normalize_storage.extracted_packages.storage.make_full_path(extracted_items_file),
+            new_columns,
+            row_groups_per_read=self.REWRITE_ROW_GROUPS,
+            memory_map=True,
+        ):
+            items_count += batch.num_rows
+            # we may need to normalize
+            if is_native_arrow_writer and should_normalize is None:
+                should_normalize, _, _, _, _ = pyarrow.should_normalize_arrow_schema(
+                    batch.schema, columns_schema, schema.naming
+                )
                 if should_normalize:
-                    batch = pyarrow.normalize_py_arrow_item(
-                        batch, columns_schema, schema.naming, self.config.destination_capabilities
+                    logger.info(
+                        f"When writing arrow table to {root_table_name} the schema requires"
+                        " normalization because its shape does not match the actual schema of"
+                        " destination table. Arrow table columns will be reordered and missing"
+                        " columns will be added if needed."
                     )
-                self.item_storage.write_data_item(
-                    load_id,
-                    schema.name,
-                    root_table_name,
-                    batch,
-                    columns_schema,
+            if should_normalize:
+                batch = pyarrow.normalize_py_arrow_item(
+                    batch, columns_schema, schema.naming, self.config.destination_capabilities
                 )
+            self.item_storage.write_data_item(
+                load_id,
+                schema.name,
+                root_table_name,
+                batch,
+                columns_schema,
+            )
         # TODO: better to check if anything is in the buffer and skip writing file
         if items_count == 0 and not is_native_arrow_writer:
             self.item_storage.write_empty_items_file(
@@ -356,11 +374,13 @@ class ArrowItemsNormalizer(ItemsNormalizer):
         # read schema and counts from file metadata
         from dlt.common.libs.pyarrow import get_parquet_metadata
 
-        with self.normalize_storage.extracted_packages.storage.open_file(
-            extracted_items_file, "rb"
-        ) as f:
-            num_rows, arrow_schema = get_parquet_metadata(f)
-            file_metrics = DataWriterMetrics(extracted_items_file, num_rows, f.tell(), 0, 0)
+        extracted_items_path = self.normalize_storage.extracted_packages.storage.make_full_path(
+            extracted_items_file
+        )
+        num_rows, arrow_schema = get_parquet_metadata(extracted_items_path)
+        file_metrics = DataWriterMetrics(
+            extracted_items_file, num_rows, os.path.getsize(extracted_items_path), 0, 0
+        )
         # when parquet files is saved, timestamps will be truncated and coerced. take the updated values
         # and apply them to dlt schema
         base_schema_update = self._fix_schema_precisions(root_table_name, arrow_schema)
@@ -397,8 +417,15 @@ class ArrowItemsNormalizer(ItemsNormalizer):
             self.load_id,
             self.schema.name,
             parts.table_name,
-            self.normalize_storage.extracted_packages.storage.make_full_path(extracted_items_file),
+            extracted_items_path,
             file_metrics,
         )
 
         return base_schema_update
+
+
+ITEMS_NORMALIZERS: Dict[TDataItemFormat, Type[ItemsNormalizer]] = {
+    "object": JsonLItemsNormalizer,
+    "arrow": ArrowItemsNormalizer,
+}
+"""Items normalizer class for each data item format"""
@@ -1,10 +1,10 @@
 import os
-import itertools
-from typing import Callable, List, Dict, NamedTuple, Sequence, Tuple, Set, Optional
-from concurrent.futures import Future, Executor
+import pickle
+from functools import lru_cache
+from typing import Callable, List, Dict, NamedTuple, Sequence, Tuple, Set, Optional, Union
+from concurrent.futures import Executor, wait, FIRST_COMPLETED
 
 from dlt.common import logger
-from dlt.common.runtime.signals import sleep
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.configuration.container import Container
@@ -20,8 +20,8 @@ from dlt.common.data_writers.writers import EMPTY_DATA_WRITER_METRICS
 from dlt.common.runners import TRunMetrics, Runnable, NullExecutor
 from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
-from dlt.common.schema.typing import TStoredSchema, TTableSchema
-from dlt.common.schema.utils import merge_schema_updates
+from dlt.common.schema.typing import TPartialTableSchema, TStoredSchema, TTableSchema
+from dlt.common.schema.utils import diff_table, merge_partial_tables, merge_schema_updates
 from dlt.common.storages import (
     NormalizeStorage,
     SchemaStorage,
@@ -40,15 +40,10 @@ from dlt.common.pipeline import (
 )
 from dlt.common.storages.exceptions import LoadPackageNotFound
 from dlt.common.storages.load_package import LoadPackageInfo
-from dlt.common.utils import chunks
 
 from dlt.normalize.configuration import NormalizeConfiguration
 from dlt.normalize.exceptions import NormalizeJobFailed
-from dlt.normalize.items_normalizers import (
-    ArrowItemsNormalizer,
-    JsonLItemsNormalizer,
-    ItemsNormalizer,
-)
+from dlt.normalize.items_normalizers import ITEMS_NORMALIZERS, ItemsNormalizer
 
 
 class TWorkerRV(NamedTuple):
@@ -104,10 +99,13 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         config: NormalizeConfiguration,
         normalize_storage_config: NormalizeStorageConfiguration,
         loader_storage_config: LoadStorageConfiguration,
-        stored_schema: TStoredSchema,
+        stored_schema: Union[TStoredSchema, bytes],
         load_id: str,
         extracted_items_files: Sequence[str],
     ) -> TWorkerRV:
+        """Normalizes `extracted_items_files` with a schema created from `stored_schema`. Schema may
+        be passed pickled so it is serialized once and shared by all tasks submitted to a pool.
+        """
         destination_caps = config.destination_capabilities
         schema_updates: List[TSchemaUpdate] = []
         # normalizers are cached per table name
@@ -121,9 +119,13 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         supported_file_formats = destination_caps.supported_loader_file_formats or []
         supported_table_formats = destination_caps.supported_table_formats or []
 
+        schema_dict: TStoredSchema = (
+            pickle.loads(stored_schema) if isinstance(stored_schema, bytes) else stored_schema
+        )
+
         # process all files with data items and write to buffered item storage
         with Container().injectable_context(destination_caps):
-            schema = Schema.from_stored_schema(stored_schema)
+            schema = Schema.from_stored_schema(schema_dict)
             normalize_storage = NormalizeStorage(False, normalize_storage_config)
             load_storage = LoadStorage(False, supported_file_formats, loader_storage_config)
 
@@ -196,7 +198,7 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
                         f" {item_storage.writer_cls.__name__} writer is used that internally"
                         f" converts {item_format}. This will degrade performance."
                     )
-                cls = ArrowItemsNormalizer if item_format == "arrow" else JsonLItemsNormalizer
+                cls = ITEMS_NORMALIZERS[item_format]
                 logger.info(
                     f"Created items normalizer {cls.__name__} with writer"
                     f" {item_storage.writer_cls.__name__} for item format {item_format} and file"
@@ -242,6 +244,10 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
                         raise NormalizeJobFailed(load_id, job_id, str(exc), writer_metrics)
                 return writer_metrics
 
+            @lru_cache(maxsize=1024)
+            def _normalize_root_table_name(table_name: str) -> str:
+                return schema.naming.normalize_table_identifier(table_name)
+
             parsed_file_name: ParsedLoadJobFileName = None
             try:
                 root_tables: Set[str] = set()
@@ -249,13 +255,11 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
                     parsed_file_name = ParsedLoadJobFileName.parse(extracted_items_file)
                     # normalize table name in case the normalization changed
                     # NOTE: this is the best we can do, until a full lineage information is in the schema
-                    root_table_name = schema.naming.normalize_table_identifier(
-                        parsed_file_name.table_name
-                    )
+                    root_table_name = _normalize_root_table_name(parsed_file_name.table_name)
                     root_tables.add(root_table_name)
                     normalizer = _get_items_normalizer(
                         DataWriter.item_format_from_file_extension(parsed_file_name.file_format),
-                        stored_schema["tables"].get(root_table_name, {"name": root_table_name}),
+                        schema_dict["tables"].get(root_table_name, {"name": root_table_name}),
                     )
                     logger.debug(
                         f"Processing extracted items in {extracted_items_file} in load_id"
@@ -275,42 +279,93 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
             return TWorkerRV(schema_updates, writer_metrics)
 
     def update_table(self, schema: Schema, schema_updates: List[TSchemaUpdate]) -> None:
+        """Merges `schema_updates` into `schema`. Partial tables are combined per table so schema is
+        updated once per table. All tables are checked against the schema first so a conflict
+        raises before schema is modified.
+        """
+        table_updates: Dict[str, List[TPartialTableSchema]] = {}
         for schema_update in schema_updates:
-            for table_name, table_updates in schema_update.items():
-                logger.info(
-                    f"Updating schema for table {table_name} with {len(table_updates)} deltas"
-                )
-                for partial_table in table_updates:
-                    # merge columns
-                    schema.update_table(partial_table)
+            for table_name, partial_tables in schema_update.items():
+                table_updates.setdefault(table_name, []).extend(partial_tables)
+        merged_tables = [
+            merge_partial_tables(partial_tables)
+            for partial_tables in table_updates.values()
+            if partial_tables
+        ]
+        for partial_table in merged_tables:
+            if table := schema.tables.get(partial_table["name"]):
+                diff_table(table, partial_table)
+        for partial_table in merged_tables:
+            table_name = partial_table["name"]
+            logger.info(
+                f"Updating schema for table {table_name} with"
+                f" {len(table_updates[table_name])} deltas"
+            )
+            schema.update_table(partial_table)
+
+    @staticmethod
+    def _worker_file_sort_key(file: str) -> Tuple[str, str, str]:
+        # table name is the first and file format the last component of the job file name
+        file_name = os.path.basename(file)
+        return file_name.split(".", 1)[0], file_name.rsplit(".", 1)[-1], file
 
     @staticmethod
-    def group_worker_files(files: Sequence[str], no_groups: int) -> List[Sequence[str]]:
-        # sort files so the same tables are in the same worker
-        files = list(sorted(files))
-
-        chunk_size = max(len(files) // no_groups, 1)
-        chunk_files = list(chunks(files, chunk_size))
-        # distribute the remainder files to existing groups starting from the end
-        remainder_l = len(chunk_files) - no_groups
-        l_idx = 0
-        while remainder_l > 0:
-            for idx, file in enumerate(reversed(chunk_files.pop())):
-                chunk_files[-l_idx - idx - remainder_l].append(file)  # type: ignore
-            remainder_l -= 1
-            l_idx = idx + 1
+    def group_worker_files(
+        files: Sequence[str], no_groups: int, file_size: Callable[[str], int] = None
+    ) -> List[Sequence[str]]:
+        """Splits `files` into up to `no_groups` contiguous groups of files sorted by table name and
+        file format. Groups have similar number of files or, if `file_size` is provided, similar
+        total size so a group with large files does not delay the whole package.
+        """
+        # sort files so the same tables and file formats are in the same worker
+        files = sorted(files, key=Normalize._worker_file_sort_key)
+        no_groups = min(no_groups, len(files))
+        if no_groups == 0:
+            return []
+
+        chunk_files: List[Sequence[str]] = []
+        start = 0
+        if file_size is None:
+            # first groups take one extra file each if files do not divide evenly
+            chunk_size, remainder_l = divmod(len(files), no_groups)
+            for idx in range(no_groups):
+                end = start + chunk_size + (1 if idx < remainder_l else 0)
+                chunk_files.append(files[start:end])
+                start = end
+            return chunk_files
+
+        # close each group at the file that brings total size closest to its share
+        sizes = [max(file_size(file), 1) for file in files]
+        total_size = sum(sizes)
+        acc_size = 0
+        for idx in range(no_groups - 1):
+            target_size = total_size * (idx + 1) / no_groups
+            # each group has at least one file and leaves at least one file for each next group
+            end = start + 1
+            acc_size += sizes[start]
+            max_end = len(files) - (no_groups - idx - 1)
+            while end < max_end and acc_size + sizes[end] / 2 <= target_size:
+                acc_size += sizes[end]
+                end += 1
+            chunk_files.append(files[start:end])
+            start = end
+        chunk_files.append(files[start:])
         return chunk_files
 
     def map_parallel(self, schema: Schema, load_id: str, files: Sequence[str]) -> TWorkerRV:
         workers: int = getattr(self.pool, "_max_workers", 1)
-        chunk_files = self.group_worker_files(files, workers)
-        schema_dict: TStoredSchema = schema.to_dict()
+        storage = self.normalize_storage.extracted_packages.storage
+        chunk_files = self.group_worker_files(
+            files, workers, lambda file: os.path.getsize(storage.make_full_path(file))
+        )
+        # pickle schema once, otherwise the executor pickles it separately for each task
+        pickled_schema = pickle.dumps(schema.to_dict(), protocol=pickle.HIGHEST_PROTOCOL)
         param_chunk = [
             (
                 self.config,
                 self.normalize_storage.config,
                 self.load_storage.config,
-                schema_dict,
+                pickled_schema,
                 load_id,
                 files,
             )
@@ -318,52 +373,50 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         ]
         # return stats
         summary = TWorkerRV([], [])
+        # tells if schema was updated since it was last pickled
+        schema_updated = False
         # push all tasks to queue
-        tasks = [
-            (self.pool.submit(Normalize.w_normalize_files, *params), params)
-            for params in param_chunk
-        ]
+        tasks = {
+            self.pool.submit(Normalize.w_normalize_files, *params): params for params in param_chunk
+        }
 
         while len(tasks) > 0:
-            sleep(0.3)
-            # operate on copy of the list
-            for task in list(tasks):
-                pending, params = task
-                if pending.done():
-                    # collect metrics from the exception (if any)
-                    if isinstance(pending.exception(), NormalizeJobFailed):
-                        summary.file_metrics.extend(pending.exception().writer_metrics)  # type: ignore[attr-defined]
-                    # Exception in task (if any) is raised here
-                    result: TWorkerRV = pending.result()
-                    try:
-                        # gather schema from all manifests, validate consistency and combine
-                        self.update_table(schema, result[0])
-                        summary.schema_updates.extend(result.schema_updates)
-                        summary.file_metrics.extend(result.file_metrics)
-                        # update metrics
-                        self.collector.update("Files", len(result.file_metrics))
-                        self.collector.update(
-                            "Items", sum(result.file_metrics, EMPTY_DATA_WRITER_METRICS).items_count
-                        )
-                    except CannotCoerceColumnException as exc:
-                        # schema conflicts resulting from parallel executing
-                        logger.warning(
-                            f"Parallel schema update conflict, retrying task ({str(exc)}"
-                        )
-                        # delete all files produced by the task
-                        for metrics in result.file_metrics:
-                            os.remove(metrics.file_path)
-                        # schedule the task again
-                        schema_dict = schema.to_dict()
-                        # TODO: it's time for a named tuple
-                        params = params[:3] + (schema_dict,) + params[4:]
-                        retry_pending: Future[TWorkerRV] = self.pool.submit(
-                            Normalize.w_normalize_files, *params
+            # block until any of the tasks completes, wake up periodically to check signals
+            done, _ = wait(list(tasks), timeout=0.3, return_when=FIRST_COMPLETED)
+            signals.raise_if_signalled()
+            for pending in done:
+                params = tasks.pop(pending)
+                # collect metrics from the exception (if any)
+                if isinstance(pending.exception(), NormalizeJobFailed):
+                    summary.file_metrics.extend(pending.exception().writer_metrics)  # type: ignore[attr-defined]
+                # Exception in task (if any) is raised here
+                result: TWorkerRV = pending.result()
+                try:
+                    # gather schema from all manifests, validate consistency and combine
+                    self.update_table(schema, result[0])
+                    schema_updated = schema_updated or any(result.schema_updates)
+                    summary.schema_updates.extend(result.schema_updates)
+                    summary.file_metrics.extend(result.file_metrics)
+                    # update metrics
+                    self.collector.update("Files", len(result.file_metrics))
+                    self.collector.update("Items", DataWriterMetrics.sum_items(result.file_metrics))
+                except CannotCoerceColumnException as exc:
+                    # schema conflicts resulting from parallel executing
+                    logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
+                    # delete all files produced by the task
+                    for file_path in [metrics.file_path for metrics in result.file_metrics]:
+                        os.unlink(file_path)
+                    # schedule the task again, update_table did not modify the schema
+                    # so it is pickled only if other tasks updated it in the meantime
+                    if schema_updated:
+                        pickled_schema = pickle.dumps(
+                            schema.to_dict(), protocol=pickle.HIGHEST_PROTOCOL
                         )
-                        tasks.append((retry_pending, params))
-                    # remove finished tasks
-                    tasks.remove(task)
-                logger.debug(f"{len(tasks)} tasks still remaining for {load_id}...")
+                        schema_updated = False
+                    # TODO: it's time for a named tuple
+                    params = params[:3] + (pickled_schema,) + params[4:]
+                    tasks[self.pool.submit(Normalize.w_normalize_files, *params)] = params
+            logger.debug(f"{len(tasks)} tasks still remaining for {load_id}...")
 
         return summary
 
@@ -378,9 +431,7 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         )
         self.update_table(schema, result.schema_updates)
         self.collector.update("Files", len(result.file_metrics))
-        self.collector.update(
-            "Items", sum(result.file_metrics, EMPTY_DATA_WRITER_METRICS).items_count
-        )
+        self.collector.update("Items", DataWriterMetrics.sum_items(result.file_metrics))
         return result
 
     def spool_files(
@@ -390,11 +441,13 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         schema_updates, writer_metrics = map_f(schema, load_id, files)
         # compute metrics
         job_metrics = {ParsedLoadJobFileName.parse(m.file_path): m for m in writer_metrics}
+        # files of a table may come from many workers so they are not contiguous
+        metrics_by_table: Dict[str, List[DataWriterMetrics]] = {}
+        for job, metrics in job_metrics.items():
+            metrics_by_table.setdefault(job.table_name, []).append(metrics)
         table_metrics: Dict[str, DataWriterMetrics] = {
-            table_name: sum(map(lambda pair: pair[1], metrics), EMPTY_DATA_WRITER_METRICS)
-            for table_name, metrics in itertools.groupby(
-                job_metrics.items(), lambda pair: pair[0].table_name
-            )
+            table_name: sum(metrics, EMPTY_DATA_WRITER_METRICS)
+            for table_name, metrics in metrics_by_table.items()
         }
         # update normalizer specific info
         for table_name in table_metrics:
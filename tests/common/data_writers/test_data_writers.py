@@ -185,6 +185,9 @@ def test_data_writer_metrics_add() -> None:
     # time range extends when added
     add_m = metrics + DataWriterMetrics("file", 99, 120, now - 10, now + 20)  # type: ignore[assignment]
     assert add_m == DataWriterMetrics("", 109, 220, now - 10, now + 20)
+    # items are summed without adding metrics
+    assert DataWriterMetrics.sum_items((metrics, add_m)) == 119
+    assert DataWriterMetrics.sum_items([]) == 0
 
 
 def test_is_native_writer() -> None:
@@ -441,6 +441,34 @@ def test_merge_tables_incomplete_columns() -> None:
     assert list(table["columns"].keys()) == ["test_2", "test"]
 
 
+def test_merge_partial_tables() -> None:
+    partial_1: TTableSchema = {"name": "table", "columns": {"test": COL_1_HINTS}}
+    partial_2: TTableSchema = {
+        "name": "table",
+        "description": "description",
+        "columns": {"test_2": COL_2_HINTS},
+    }
+    partial_3: TTableSchema = {"name": "table", "columns": deepcopy({"test_2": COL_2_HINTS})}
+    partial_3["columns"]["test_2"]["data_type"] = "bigint"
+    partials = deepcopy([partial_1, partial_2, partial_3])
+    merged = utils.merge_partial_tables(partials)
+    # partial tables are not modified
+    assert partials == [partial_1, partial_2, partial_3]
+    # same result as merging partials one by one
+    table = deepcopy(partial_1)
+    utils.merge_table(table, partial_2)
+    utils.merge_table(table, partial_3)
+    assert merged == table
+    assert merged["description"] == "description"
+    assert merged["columns"]["test_2"]["data_type"] == "bigint"
+
+    # conflicting partials raise
+    partial_4 = deepcopy(partial_3)
+    partial_4["columns"]["test_2"]["data_type"] = "text"
+    with pytest.raises(CannotCoerceColumnException):
+        utils.merge_partial_tables([partial_3, partial_4])
+
+
 # def add_column_defaults(column: TColumnSchemaBase) -> TColumnSchema:
 #     """Adds default boolean hints to column"""
 #     return {
@@ -240,6 +240,11 @@ def test_open_compressed() -> None:
         assert isinstance(content, str)
         assert content == bstr.decode("utf-8")
 
+    # buffering is accepted for both compressed and uncompressed files
+    for fn in (fname, fname[:-3]):
+        with FileStorage.open_zipsafe_ro(fn, mode="rb", buffering=1 << 20) as f:
+            assert f.read() == bstr
+
 
 def test_hard_link() -> None:
     storage = FileStorage(TEST_STORAGE_ROOT, file_type="b")
@@ -1,6 +1,9 @@
+import os
 from copy import deepcopy
 from datetime import timezone, datetime, timedelta  # noqa: I251
 import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
 
 from dlt.common import pendulum
 from dlt.common.libs.pyarrow import (
@@ -8,11 +11,13 @@ from dlt.common.libs.pyarrow import (
     get_py_arrow_timestamp,
     py_arrow_to_table_schema_columns,
     get_py_arrow_datatype,
+    pq_stream_with_new_columns,
     to_arrow_scalar,
 )
 from dlt.common.destination import DestinationCapabilitiesContext
 
 from tests.cases import TABLE_UPDATE_COLUMNS_SCHEMA
+from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage
 
 
 def test_py_arrow_to_table_schema_columns():
@@ -109,3 +114,23 @@ def test_from_arrow_scalar() -> None:
     assert isinstance(py_dt, pendulum.DateTime)
     assert py_dt.tzname() == "UTC"
     assert py_dt == datetime(2021, 1, 1, 13, 2, 32, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("memory_map", (True, False))
+def test_pq_stream_with_new_columns(memory_map: bool) -> None:
+    table = pa.table({"id": list(range(10))})
+    path = os.path.join(TEST_STORAGE_ROOT, "table.parquet")
+    pq.write_table(table, path, row_group_size=3)
+    new_columns = [
+        (-1, pa.field("last", pa.int64()), lambda tbl: pa.repeat(pa.scalar(1), tbl.num_rows)),
+        (0, pa.field("first", pa.string()), lambda tbl: pa.array(["a"] * tbl.num_rows)),
+    ]
+    batches = list(
+        pq_stream_with_new_columns(path, new_columns, row_groups_per_read=2, memory_map=memory_map)
+    )
+    # 4 row groups read two at a time
+    assert [batch.num_rows for batch in batches] == [6, 4]
+    result = pa.concat_tables(batches)
+    assert result.column_names == ["first", "id", "last"]
+    assert result["id"].to_pylist() == list(range(10))
+    assert result["last"].to_pylist() == [1] * 10
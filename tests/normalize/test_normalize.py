@@ -6,6 +6,7 @@ from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from dlt.common import json
 from dlt.common.destination.capabilities import TLoaderFileFormat
 from dlt.common.schema.schema import Schema
+from dlt.common.schema.exceptions import CannotCoerceColumnException
 from dlt.common.schema.utils import new_table
 from dlt.common.storages.exceptions import SchemaNotFoundError
 from dlt.common.typing import StrAny
@@ -297,6 +298,31 @@ def test_multiprocessing_row_counting(
     assert row_counts == step_info.row_counts
 
 
+def test_table_metrics_from_many_workers(raw_normalize: Normalize) -> None:
+    with open(json_case_path("github.events.load_page_1_duck"), "rb") as f:
+        items = json.load(f)
+    schema = load_or_create_schema(raw_normalize, "github")
+    extractor = ExtractStorage(raw_normalize.normalize_storage.config)
+    load_id = extractor.create_load_package(schema)
+    # write two files so each worker produces files for all the tables
+    for chunk in (items[:50], items[50:]):
+        extractor.item_storages["object"].write_data_item(
+            load_id, schema.name, "events", chunk, None
+        )
+        extractor.close_writers(load_id)
+    extractor.commit_new_load_package(load_id, schema)
+    with ThreadPoolExecutor(max_workers=2) as p:
+        raw_normalize.run(p)
+    step_info = raw_normalize.get_step_info(MockPipeline("multiprocessing_pipeline", True))  # type: ignore[abstract]
+    assert step_info.row_counts["events"] == 100
+    assert step_info.row_counts["events__payload__pull_request__requested_reviewers"] == 24
+    job_row_counts: Dict[str, int] = {}
+    for job_id, m in step_info.metrics[load_id][0]["job_metrics"].items():
+        table_name = job_id.split(".")[0]
+        job_row_counts[table_name] = job_row_counts.get(table_name, 0) + m.items_count
+    assert job_row_counts == step_info.row_counts
+
+
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
 def test_normalize_many_packages(
     caps: DestinationCapabilitiesContext, rasa_normalize: Normalize
@@ -507,6 +533,23 @@ def test_collect_metrics_on_exception(raw_normalize: Normalize) -> None:
     raw_normalize.get_step_info(MockPipeline("multiprocessing_pipeline", True))  # type: ignore[abstract]
 
 
+def test_update_table_conflict_is_atomic(raw_normalize: Normalize) -> None:
+    schema = Schema("event")
+    schema.update_table(new_table("items", columns=[{"name": "id", "data_type": "bigint"}]))
+    schema_updates = [
+        {
+            "items": [new_table("items", columns=[{"name": "name", "data_type": "text"}])],
+            "items_2": [new_table("items_2", columns=[{"name": "id", "data_type": "text"}])],
+        },
+        {"items": [new_table("items", columns=[{"name": "id", "data_type": "text"}])]},
+    ]
+    with pytest.raises(CannotCoerceColumnException):
+        raw_normalize.update_table(schema, schema_updates)
+    # nothing was applied
+    assert list(schema.get_table_columns("items")) == ["id"]
+    assert "items_2" not in schema.tables
+
+
 def test_group_worker_files() -> None:
     files = ["f%03d" % idx for idx in range(0, 100)]
 
@@ -515,10 +558,10 @@ def test_group_worker_files() -> None:
     assert Normalize.group_worker_files(["f001"], 100) == [["f001"]]
     assert Normalize.group_worker_files(files[:4], 4) == [["f000"], ["f001"], ["f002"], ["f003"]]
     assert Normalize.group_worker_files(files[:5], 4) == [
-        ["f000"],
-        ["f001"],
+        ["f000", "f001"],
         ["f002"],
-        ["f003", "f004"],
+        ["f003"],
+        ["f004"],
     ]
     assert Normalize.group_worker_files(files[:8], 4) == [
         ["f000", "f001"],
@@ -527,22 +570,46 @@ def test_group_worker_files() -> None:
         ["f006", "f007"],
     ]
     assert Normalize.group_worker_files(files[:8], 3) == [
-        ["f000", "f001"],
-        ["f002", "f003", "f006"],
-        ["f004", "f005", "f007"],
+        ["f000", "f001", "f002"],
+        ["f003", "f004", "f005"],
+        ["f006", "f007"],
     ]
     assert Normalize.group_worker_files(files[:5], 3) == [
-        ["f000"],
-        ["f001", "f003"],
-        ["f002", "f004"],
+        ["f000", "f001"],
+        ["f002", "f003"],
+        ["f004"],
     ]
+    # groups differ in size by at most one file
+    groups = Normalize.group_worker_files(files, 7)
+    assert [len(group) for group in groups] == [15, 15, 14, 14, 14, 14, 14]
+    assert [file for group in groups for file in group] == files
 
     # check if sorted
     files = ["tab1.1", "chd.3", "tab1.2", "chd.4", "tab1.3"]
     assert Normalize.group_worker_files(files, 3) == [
-        ["chd.3"],
-        ["chd.4", "tab1.2"],
-        ["tab1.1", "tab1.3"],
+        ["chd.3", "chd.4"],
+        ["tab1.1", "tab1.2"],
+        ["tab1.3"],
+    ]
+
+    # groups are balanced by size if provided
+    sizes = {"f000": 100, "f001": 10, "f002": 10, "f003": 10, "f004": 50, "f005": 50, "f006": 0}
+    assert Normalize.group_worker_files(list(sizes), 3, sizes.__getitem__) == [
+        ["f000"],
+        ["f001", "f002", "f003"],
+        ["f004", "f005", "f006"],
+    ]
+    # each group gets at least one file
+    assert Normalize.group_worker_files(list(sizes), 7, sizes.__getitem__) == [
+        [file] for file in sizes
+    ]
+    assert Normalize.group_worker_files(["f001"], 4, sizes.__getitem__) == [["f001"]]
+    assert Normalize.group_worker_files([], 4, sizes.__getitem__) == []
+
+    # files of the same table are grouped by file format
+    files = ["tab.2.0.parquet", "tab.1.0.typed-jsonl", "tab.3.0.parquet", "chd.4.0.typed-jsonl"]
+    assert Normalize.group_worker_files(files, 1) == [
+        ["chd.4.0.typed-jsonl", "tab.2.0.parquet", "tab.3.0.parquet", "tab.1.0.typed-jsonl"]
     ]
 
 